@@ -76,6 +76,30 @@ LOC_TRANSLATE = {  # for inset colorbars and legends TODO: also as text location
     'uc': 'upper center',
     'lc': 'lower center',
 }
+LOC_OPTIONS = {  # valid standardized locations for each _loc_translate mode
+    'legend': tuple(LOC_TRANSLATE.values()),
+    'panel': ('left', 'right', 'top', 'bottom'),
+    'colorbar': (
+        'best', 'left', 'right', 'top', 'bottom',
+        'upper left', 'upper right', 'lower left', 'lower right',
+    ),
+    'abc': (
+        'left', 'center', 'right',
+        'upper left', 'upper center', 'upper right',
+        'lower left', 'lower center', 'lower right',
+    ),
+}
+LOC_OPTIONS['title'] = LOC_OPTIONS['abc']
+LOC_TRANSLATE_MODES = {  # build translation dictionaries once on import
+    mode: {
+        key: value
+        for short, long in LOC_TRANSLATE.items()
+        for key, value in ((long, long), (short, long))
+        if long in options
+    }
+    for mode, options in LOC_OPTIONS.items()
+}
+ABC_REGEX = re.compile('[aA]')
 
 
 docstring.snippets['axes.other'] = """
@@ -432,29 +456,10 @@ class Axes(maxes.Axes):
         """
         Return the location string `loc` translated into a standardized form.
         """
-        if mode == 'legend':
-            options = tuple(LOC_TRANSLATE.values())
-        elif mode == 'panel':
-            options = ('left', 'right', 'top', 'bottom')
-        elif mode == 'colorbar':
-            options = (
-                'best', 'left', 'right', 'top', 'bottom',
-                'upper left', 'upper right', 'lower left', 'lower right',
-            )
-        elif mode in ('abc', 'title'):
-            options = (
-                'left', 'center', 'right',
-                'upper left', 'upper center', 'upper right',
-                'lower left', 'lower center', 'lower right',
-            )
-        else:
+        try:
+            loc_translate = LOC_TRANSLATE_MODES[mode]
+        except KeyError:
             raise ValueError(f'Invalid mode {mode!r}.')
-        loc_translate = {
-            key: value
-            for short, long in LOC_TRANSLATE.items()
-            for key, value in ((long, long), (short, long))
-            if long in options
-        }
         if loc in (None, True):
             context = mode in ('abc', 'title')
             loc = rc.get(mode + '.loc', context=context)
@@ -917,7 +922,7 @@ optional
                         f'Invalid abcstyle {style!r}. Must include letter "a" or "A".'
                     )
                 nabc, iabc = divmod(self.number - 1, 26)
-                old = re.search('[aA]', style).group()  # return the *first* 'a'
+                old = ABC_REGEX.search(style).group()  # return the *first* 'a'
                 new = (nabc + 1) * ABC_STRING[iabc]
                 new = new.upper() if old == 'A' else new
                 self._abc_text = style.replace(old, new, 1)
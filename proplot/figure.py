@@ -419,7 +419,7 @@ class Figure(mfigure.Figure):
         # True indicates the slot has been filled
         iratio = -1 if side in ('left', 'top') else nacross  # default values
         for i in range(npanels):
-            if not any(array[i, start:stop]):
+            if not array[i, start:stop].any():
                 array[i, start:stop] = True
                 if side in ('left', 'top'):  # descending moves us closer to 0
                     # npanels=1, i=0 --> iratio=0
@@ -712,7 +712,7 @@ class Figure(mfigure.Figure):
         edge = min_ if side in ('left', 'top') else max_
 
         # Return axes on edge sorted by order of appearance
-        axs = [ax for ax in self._axes_main if ax._range_gridspec(x)[idx] == edge]
+        axs = [ax for ax, irange in zip(axs, ranges) if irange[idx] == edge]
         ranges = [ax._range_gridspec(y)[0] for ax in axs]
         return [ax for _, ax in sorted(zip(ranges, axs)) if ax.get_visible()]
 
@@ -971,6 +971,9 @@ class Figure(mfigure.Figure):
         hspace = subplots_kw['hspace']
         wspace_orig = subplots_orig_kw['wspace']
         hspace_orig = subplots_orig_kw['hspace']
+        ranges = {  # reused for both spacing directions
+            x: np.array([ax._range_gridspec(x) for ax in axs]) for x in 'xy'
+        }
 
         # Get new subplot spacings, axes panel spacing, figure panel spacing
         spaces = []
@@ -981,8 +984,12 @@ class Figure(mfigure.Figure):
             # Determine which rows and columns correspond to panels
             panels = subplots_kw[w + 'panels']
             jspace = [*ispace]
-            ralong = np.array([ax._range_gridspec(x) for ax in axs])
-            racross = np.array([ax._range_gridspec(y) for ax in axs])
+            ralong, racross = ranges[x], ranges[y]
+            # NOTE: Find the axes spanning each row (column) for all rows at once
+            # and skip rows without interfaces, i.e. with fewer than two axes.
+            jfilts = np.arange(nacross)[:, None]
+            jfilts = (racross[:, 0] <= jfilts) & (jfilts <= racross[:, 1])
+            jfilts = jfilts[np.count_nonzero(jfilts, axis=1) >= 2]
             for i, (space, space_orig) in enumerate(zip(ispace, ispace_orig)):
                 # Figure out whether this is a normal space, or a
                 # panel stack space/axes panel space
@@ -999,17 +1006,15 @@ class Figure(mfigure.Figure):
 
                 # Find axes that abutt aginst this space on each row
                 groups = []
+                igroups1, igroups2 = {}, {}  # axes to index of first group
                 filt1 = ralong[:, 1] == i  # i.e. right/bottom edge abutts against this
                 filt2 = ralong[:, 0] == i + 1  # i.e. left/top edge abutts against this
-                for j in range(nacross):  # e.g. each row
+                for filt in jfilts:  # e.g. each row
 
                     # Get indices
-                    filt = (racross[:, 0] <= j) & (j <= racross[:, 1])
-                    if sum(filt) < 2:  # no interface here
-                        continue
                     idx1, = np.where(filt & filt1)
                     idx2, = np.where(filt & filt2)
-                    if idx1.size > 1 or idx2.size > 2:
+                    if idx1.size > 1 or idx2.size > 1:
                         warnings._warn_proplot('This should never happen.')
                         continue
                     elif not idx1.size or not idx2.size:
@@ -1021,15 +1026,19 @@ class Figure(mfigure.Figure):
                     ax1, ax2 = axs[idx1], axs[idx2]
                     if x != 'x':  # order bottom-to-top
                         ax1, ax2 = ax2, ax1
-                    newgroup = True
-                    for (group1, group2) in groups:
-                        if ax1 in group1 or ax2 in group2:
-                            newgroup = False
-                            group1.add(ax1)
-                            group2.add(ax2)
-                            break
-                    if newgroup:
+                    # NOTE: Look up the first group containing either axes.
+                    igroups = (igroups1.get(ax1, None), igroups2.get(ax2, None))
+                    igroups = [igroup for igroup in igroups if igroup is not None]
+                    if igroups:
+                        igroup = min(igroups)
+                        group1, group2 = groups[igroup]
+                        group1.add(ax1)
+                        group2.add(ax2)
+                    else:
+                        igroup = len(groups)
                         groups.append([{ax1}, {ax2}])  # form new group
+                    igroups1[ax1] = min(igroups1.get(ax1, igroup), igroup)
+                    igroups2[ax2] = min(igroups2.get(ax2, igroup), igroup)
 
                 # Get spaces
                 # Layout is lspace, lspaces[0], rspaces[0], wspace, ...
@@ -18,44 +18,54 @@ def _default_space(key, share=0, pad=None):
     """
     Return suitable default spacing given a shared axes setting.
     """
-    # Pull out sizes
-    outerpad = _not_none(pad, rc['subplots.pad'])  # TODO: rename to outerpad, innerpad
-    innerpad = _not_none(pad, rc['subplots.axpad'])
-    xtick = rc['xtick.major.size']
-    ytick = rc['ytick.major.size']
-    xtickpad = rc['xtick.major.pad']
-    ytickpad = rc['ytick.major.pad']
-    xticklabel = rc._scale_font(rc['xtick.labelsize'])
-    yticklabel = 3 * rc._scale_font(rc['ytick.labelsize'])
-    label = rc._scale_font(rc['axes.labelsize'])
-    title = rc._scale_font(rc['axes.titlesize'])
-    titlepad = rc['axes.titlepad']
-
     # Get suitable size for various spaces
+    # NOTE: Only look up the settings needed for the requested space. This is
+    # called for every figure edge and subplot gap and for every new panel.
+    if key in ('left', 'right', 'bottom', 'top'):
+        space = units(_not_none(pad, rc['subplots.pad']))  # TODO: rename to outerpad
+    elif key in ('wspace', 'hspace'):
+        space = units(_not_none(pad, rc['subplots.axpad']))  # TODO: rename to innerpad
+    else:
+        raise KeyError(f'Invalid space key {key!r}.')
     if key == 'left':
-        space = units(outerpad) + (ytick + yticklabel + ytickpad + label) / 72
-    elif key == 'right':
-        space = units(outerpad)
+        ytick = rc['ytick.major.size']
+        ytickpad = rc['ytick.major.pad']
+        yticklabel = 3 * rc._scale_font(rc['ytick.labelsize'])
+        label = rc._scale_font(rc['axes.labelsize'])
+        space += (ytick + yticklabel + ytickpad + label) / 72
     elif key == 'bottom':
-        space = units(outerpad) + (xtick + xticklabel + xtickpad + label) / 72
+        xtick = rc['xtick.major.size']
+        xtickpad = rc['xtick.major.pad']
+        xticklabel = rc._scale_font(rc['xtick.labelsize'])
+        label = rc._scale_font(rc['axes.labelsize'])
+        space += (xtick + xticklabel + xtickpad + label) / 72
     elif key == 'top':
-        space = units(outerpad) + (title + titlepad) / 72
+        title = rc._scale_font(rc['axes.titlesize'])
+        titlepad = rc['axes.titlepad']
+        space += (title + titlepad) / 72
     elif key == 'wspace':
-        space = units(innerpad) + ytick / 72
+        ytick = rc['ytick.major.size']
+        space += ytick / 72
         if share < 3:
+            ytickpad = rc['ytick.major.pad']
+            yticklabel = 3 * rc._scale_font(rc['ytick.labelsize'])
             space += (yticklabel + ytickpad) / 72
         if share < 1:
+            label = rc._scale_font(rc['axes.labelsize'])
             space += label / 72
     elif key == 'hspace':
-        space = units(innerpad) + (title + titlepad + xtick) / 72
+        xtick = rc['xtick.major.size']
+        title = rc._scale_font(rc['axes.titlesize'])
+        titlepad = rc['axes.titlepad']
+        space += (title + titlepad + xtick) / 72
         if share < 3:
+            xtickpad = rc['xtick.major.pad']
+            xticklabel = rc._scale_font(rc['xtick.labelsize'])
             space += (xticklabel + xtickpad) / 72
         if share < 0:
+            label = rc._scale_font(rc['axes.labelsize'])
             space += label / 72
 
-    else:
-        raise KeyError(f'Invalid space key {key!r}.')
-
     return space
 
 
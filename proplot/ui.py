@@ -151,17 +151,19 @@ def _axes_dict(naxs, value, kw=False, default=None):
     standardized axes-specific properties or keyword args.
     """
     # First build up dictionary
+    # NOTE: Global values are by far the most common input, so return them
+    # immediately.
     # 1) 'string' or {1:'string1', (2,3):'string2'}
     if not kw:
         if np.iterable(value) and not isinstance(value, (str, dict)):
             value = {num + 1: item for num, item in enumerate(value)}
         elif not isinstance(value, dict):
-            value = {range(1, naxs + 1): value}
+            return {num: value for num in range(1, naxs + 1)}
     # 2) {'prop':value} or {1:{'prop':value1}, (2,3):{'prop':value2}}
     else:
         nested = [isinstance(value, dict) for value in value.values()]
         if not any(nested):  # any([]) == False
-            value = {range(1, naxs + 1): value.copy()}
+            return {num: value.copy() for num in range(1, naxs + 1)}
         elif not all(nested):
             raise ValueError(
                 'Pass either of dictionary of key value pairs or '
@@ -169,14 +171,17 @@ def _axes_dict(naxs, value, kw=False, default=None):
             )
     # Then *unfurl* keys that contain multiple axes numbers, i.e. are meant
     # to indicate properties for multiple axes at once
+    # NOTE: Each item index is repeated once for every axes number in its key.
     kwargs = {}
-    for nums, item in value.items():
-        nums = np.atleast_1d(nums)
-        for num in nums.flat:
-            if not kw:
-                kwargs[num] = item
-            else:
-                kwargs[num] = item.copy()
+    if value:
+        items = tuple(value.values())
+        nums = [np.atleast_1d(num).ravel() for num in value]
+        idxs = np.repeat(np.arange(len(items)), [num.size for num in nums])
+        nums = np.concatenate(nums)
+        kwargs = {
+            num: items[idx].copy() if kw else items[idx]
+            for num, idx in zip(nums.tolist(), idxs.tolist())
+        }
     # Fill with default values
     for num in range(1, naxs + 1):
         if num not in kwargs:
@@ -185,7 +190,9 @@ def _axes_dict(naxs, value, kw=False, default=None):
             else:
                 kwargs[num] = default
     # Verify numbers
-    if {*range(1, naxs + 1)} != {*kwargs.keys()}:
+    # NOTE: Numbers 1 to naxs are always present after filling default
+    # values, so invalid numbers can only show up as extra keys.
+    if len(kwargs) != naxs:
         raise ValueError(
             f'Have {naxs} axes, but {value!r} has properties for axes '
             + ', '.join(map(repr, sorted(kwargs))) + '.'
@@ -367,28 +374,36 @@ list thereof, or dict thereof, optional
             f'Invalid order {order!r}. Choose from "C" (row-major, default) '
             f'and "F" (column-major).'
         )
+    # NOTE: Skip standardization for the default array and use np.asarray
+    # for user input arrays to avoid an unnecessary copy.
     if array is None:
-        array = np.arange(1, nrows * ncols + 1)[..., None]
+        array = np.arange(1, nrows * ncols + 1)
         array = array.reshape((nrows, ncols), order=order)
-    # Standardize array
-    try:
-        array = np.array(array, dtype=int)  # enforce array type
-        if array.ndim == 1:  # interpret as single row or column
-            array = array[None, :] if order == 'C' else array[:, None]
-        elif array.ndim != 2:
+    else:
+        try:
+            # NOTE: Only object arrays (e.g. from lists with None placeholders)
+            # can contain None, so skip the elementwise comparison otherwise.
+            array = np.asarray(array)
+            if array.dtype == object:
+                array = np.where(array == None, 0, array)  # noqa: E711
+            array = array.astype(int, copy=False)  # enforce array type
+            if array.ndim == 1:  # interpret as single row or column
+                array = array[None, :] if order == 'C' else array[:, None]
+            elif array.ndim != 2:
+                raise ValueError(
+                    f'Array must be 1-2 dimensional, but got {array.ndim} dims.'
+                )
+        except (TypeError, ValueError):
             raise ValueError(
-                f'Array must be 1-2 dimensional, but got {array.ndim} dims.'
+                f'Invalid subplot array {array!r}. '
+                'Must be 1d or 2d array of integers.'
             )
-        array[array == None] = 0  # use zero for placeholder  # noqa
-    except (TypeError, ValueError):
-        raise ValueError(
-            f'Invalid subplot array {array!r}. '
-            'Must be 1d or 2d array of integers.'
-        )
     # Get other props
+    # NOTE: Values from np.unique are sorted and distinct, so they span 1 to
+    # naxs without gaps if and only if the first is 1 and the last is naxs.
     nums = np.unique(array[array != 0])
-    naxs = len(nums)
-    if {*nums.flat} != {*range(1, naxs + 1)}:
+    naxs = nums.size
+    if naxs and (nums[0] != 1 or nums[-1] != naxs):
         raise ValueError(
             f'Invalid subplot array {array!r}. Numbers must span integers '
             '1 to naxs (i.e. cannot skip over numbers), with 0 representing '
@@ -404,9 +419,22 @@ list thereof, or dict thereof, optional
     # Get some axes properties, where locations are sorted by axes id.
     # NOTE: These ranges are endpoint exclusive, like a slice object!
     # NOTE: 0 stands for empty
-    axids = [np.where(array == i) for i in np.sort(np.unique(array)) if i > 0]
-    xrange = np.array([[x.min(), x.max()] for _, x in axids])
-    yrange = np.array([[y.min(), y.max()] for y, _ in axids])
+    # NOTE: Group the array locations by axes id with a single stable sort,
+    # then get the extents of each group with reduceat.
+    axids = array.ravel()
+    rows, cols = np.divmod(np.arange(axids.size), ncols)
+    mask = axids > 0
+    isort = np.argsort(axids[mask], kind='stable')
+    starts = np.searchsorted(axids[mask][isort], np.arange(1, naxs + 1))
+    rows, cols = rows[mask][isort], cols[mask][isort]
+    xrange = np.stack(
+        (np.minimum.reduceat(cols, starts), np.maximum.reduceat(cols, starts)),
+        axis=1,
+    )
+    yrange = np.stack(
+        (np.minimum.reduceat(rows, starts), np.maximum.reduceat(rows, starts)),
+        axis=1,
+    )
     xref = xrange[ref - 1, :]  # range for reference axes
     yref = yrange[ref - 1, :]
 
@@ -416,32 +444,44 @@ list thereof, or dict thereof, optional
     proj_kw = _not_none(projection_kw=projection_kw, proj_kw=proj_kw) or {}
     proj_kw = _axes_dict(naxs, proj_kw, kw=True)
     basemap = _axes_dict(naxs, basemap, kw=False, default=None)
-    axes_kw = {num: {} for num in range(1, naxs + 1)}  # store add_subplot args
+    axes_kw = {}  # store add_subplot args
+    projs = {}  # store Proj() results
     for num, name in proj.items():
         # The default is CartesianAxes
         if name is None or name == 'cartesian':
-            axes_kw[num]['projection'] = 'proplot_cartesian'
+            axes_kw[num] = {'projection': 'proplot_cartesian'}
 
         # Builtin matplotlib polar axes, just use my overridden version
         elif name == 'polar':
-            axes_kw[num]['projection'] = 'proplot_polar'
+            axes_kw[num] = {'projection': 'proplot_polar'}
             if num == ref:
                 aspect = 1
 
         # Builtin matplotlib 3D axes, no overwrite yet
         elif name == '3d' or name == '3D':
-            axes_kw[num]['projection'] = 'proplot_3d'
+            axes_kw[num] = {'projection': 'proplot_3d'}
 
         # Custom Basemap and Cartopy axes
+        # NOTE: Reuse projections for subplots with identical specifications.
+        # This is safe because cartopy projections are not modified by the
+        # axes and BasemapAxes makes its own copy of the Basemap instance.
         else:
-            m = constructor.Proj(name, basemap=basemap[num], **proj_kw[num])
+            key = (name, basemap[num], tuple(sorted(proj_kw[num].items())))
+            try:
+                m = projs.get(key, None)
+            except TypeError:  # unhashable keyword args
+                key = m = None
+            if m is None:
+                m = constructor.Proj(name, basemap=basemap[num], **proj_kw[num])
+                if key is not None:
+                    projs[key] = m
             package = m._proj_package
             if num == ref:
                 if package == 'basemap':
                     aspect = (m.urcrnrx - m.llcrnrx) / (m.urcrnry - m.llcrnry)
                 else:
                     aspect = (np.diff(m.x_limits) / np.diff(m.y_limits))[0]
-            axes_kw[num].update({'projection': 'proplot_' + package, 'map_projection': m})  # noqa: E501
+            axes_kw[num] = {'projection': 'proplot_' + package, 'map_projection': m}
 
     # Figure and/or axes dimensions
     names, values = (), ()
@@ -526,21 +566,28 @@ list thereof, or dict thereof, optional
     }
 
     # Apply default settings
-    share = kwargs.get('share', None)
-    sharex = _not_none(kwargs.get('sharex', None), share, rc['subplots.share'])
-    sharey = _not_none(kwargs.get('sharey', None), share, rc['subplots.share'])
-
-    left = _not_none(left, pgridspec._default_space('left'))
-    right = _not_none(right, pgridspec._default_space('right'))
-    bottom = _not_none(bottom, pgridspec._default_space('bottom'))
-    top = _not_none(top, pgridspec._default_space('top'))
-
-    wspace, hspace = np.array(wspace), np.array(hspace)  # also copies!
-    wspace[wspace == None] = pgridspec._default_space('wspace', sharex)  # noqa: E711, E501
-    hspace[hspace == None] = pgridspec._default_space('hspace', sharey)  # noqa: E711, E501
+    # NOTE: Only compute default spaces when they are needed, and only once
+    share = _not_none(kwargs.get('share', None), rc['subplots.share'])
+    sharex = _not_none(kwargs.get('sharex', None), share)
+    sharey = _not_none(kwargs.get('sharey', None), share)
+
+    if left is None:
+        left = pgridspec._default_space('left')
+    if right is None:
+        right = pgridspec._default_space('right')
+    if bottom is None:
+        bottom = pgridspec._default_space('bottom')
+    if top is None:
+        top = pgridspec._default_space('top')
 
     wratios, hratios = list(wratios), list(hratios)
-    wspace, hspace = list(wspace), list(hspace)
+    wspace, hspace = list(wspace), list(hspace)  # also copies!
+    if None in wspace:
+        default = pgridspec._default_space('wspace', sharex)
+        wspace = [default if _ is None else _ for _ in wspace]
+    if None in hspace:
+        default = pgridspec._default_space('hspace', sharey)
+        hspace = [default if _ is None else _ for _ in hspace]
 
     # Parse arguments, fix dimensions in light of desired aspect ratio
     figsize, gridspec_kw, subplots_kw = pgridspec._calc_geometry(
@@ -577,8 +624,22 @@ list thereof, or dict thereof, optional
     # Shared axes setup
     # TODO: Figure out how to defer this to drawtime in #50
     # For some reason just adding _auto_share_setup() to draw() doesn't work
-    for ax in axs:
-        ax._auto_share_setup()
+    # NOTE: This replicates the "external" sharing step in _auto_share_setup()
+    # (there are no panels yet) for groups of subplots with identical extents.
+    # A single lexsort orders each group so the parent comes first. As in
+    # _get_extent_axes(), this is the subplot with the largest row start for
+    # x axes and the smallest column end for y axes.
+    for x, irange, jkey in (
+        ('x', xrange, -yrange[:, 0]),
+        ('y', yrange, xrange[:, 1]),
+    ):
+        _, inverse = np.unique(irange, axis=0, return_inverse=True)
+        inverse = inverse.ravel()  # numpy 2.0.0 returns 2D array when axis=0
+        isort = np.lexsort((jkey, inverse))
+        splits = np.searchsorted(inverse[isort], np.arange(1, inverse.max() + 1))
+        for base, *children in np.split(isort, splits):
+            for child in children:
+                getattr(axs[child], '_share' + x + '_setup')(axs[base])
 
     # Return figure and axes
     n = ncols if order == 'C' else nrows
@@ -732,33 +793,33 @@ class SubplotsContainer(list):
             )
         objs = tuple(getattr(ax, attr) for ax in self)  # may raise error
 
+        # Count methods
+        ncallable = sum(map(callable, objs))  # single pass
         # Objects
-        if not any(callable(_) for _ in objs):
+        if not ncallable:
             if len(self) == 1:
                 return objs[0]
             else:
                 return objs
+        # Mixed
+        elif ncallable < len(objs):
+            raise AttributeError(f'Found mixed types for attribute {attr!r}.')
+
         # Methods
         # NOTE: Must manually copy docstring because help() cannot inherit it
-        elif all(callable(_) for _ in objs):
-            @functools.wraps(objs[0])
-            def _iterator(*args, **kwargs):
-                result = []
-                for func in objs:
-                    result.append(func(*args, **kwargs))
-                if len(self) == 1:
-                    return result[0]
-                elif all(res is None for res in result):
-                    return None
-                elif all(isinstance(res, paxes.Axes) for res in result):
-                    return SubplotsContainer(result, n=self._n, order=self._order)
-                else:
-                    return tuple(result)
-            _iterator.__doc__ = inspect.getdoc(objs[0])
-            return _iterator
-
-        # Mixed
-        raise AttributeError(f'Found mixed types for attribute {attr!r}.')
+        @functools.wraps(objs[0])
+        def _iterator(*args, **kwargs):
+            result = [func(*args, **kwargs) for func in objs]
+            if len(self) == 1:
+                return result[0]
+            elif all(res is None for res in result):
+                return None
+            elif all(isinstance(res, paxes.Axes) for res in result):
+                return SubplotsContainer(result, n=self._n, order=self._order)
+            else:
+                return tuple(result)
+        _iterator.__doc__ = inspect.getdoc(objs[0])
+        return _iterator
 
     @property
     def shape(self):